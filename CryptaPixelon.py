@@ -1,6 +1,12 @@
 import sys
 import random
+import re
+import queue
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
@@ -9,17 +15,76 @@ from PyQt5.QtWidgets import (
     QSlider, QTabWidget, QListWidget, QListWidgetItem, QSplitter,
     QGridLayout, QFrame, QGroupBox, QCheckBox
 )
-from PyQt5.QtGui import QPixmap, QFont, QColor, QIcon
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QFont, QColor, QIcon
+from PyQt5.QtCore import Qt, QEvent, QObject, QRunnable, QThread, QThreadPool, QSize, QTimer, pyqtSignal
 from PIL import Image
 import numpy as np
 import os
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Opt-in CUDA offload for batch processing (set CRYPTAPIXELON_GPU=1)
+USE_GPU = bool(os.environ.get('CRYPTAPIXELON_GPU')) and cupy is not None
+
+# Integer BT.601 luma weights scaled by 256 (77 + 150 + 29 == 256)
+LUMA_WEIGHTS = np.array([77, 150, 29], dtype=np.uint16)
+
+# Lower-case suffixes accepted by drag and drop
+_IMG_EXTS = frozenset(('.png', '.jpg', '.jpeg', '.bmp'))
+
 
 # ============================================================================
 # AI LOGIC & ANALYSIS MODULE
 # ============================================================================
 
+if njit is not None:
+    # Serial on purpose: it already runs off the GUI thread, and a parallel
+    # kernel called from a worker thread can hang interpreter exit under TBB
+    @njit(cache=True, fastmath=True)
+    def _analyze_gray(gray):
+        """Single-pass entropy, brightness, contrast and edge density"""
+        rows, cols = gray.shape
+        hist = np.zeros(256, dtype=np.int64)
+        total = 0.0
+        total_sq = 0.0
+        edges = 0
+
+        for i in range(rows):
+            for j in range(cols):
+                v = gray[i, j]
+                hist[v] += 1
+                total += v
+                total_sq += v * v
+                if i > 0 and abs(np.int16(v) - np.int16(gray[i - 1, j])) > 10:
+                    edges += 1
+
+        n = rows * cols
+        entropy = 0.0
+        for b in range(256):
+            if hist[b] > 0:
+                p = hist[b] / n
+                entropy -= p * np.log2(p)
+
+        mean = total / n
+        variance = max(total_sq / n - mean * mean, 0.0)
+        return entropy, mean, np.sqrt(variance), edges / n
+else:
+    _analyze_gray = None
+
+
 class ImageAnalyzer:
     """AI-powered image analysis for smart encryption"""
 
@@ -28,25 +93,27 @@ class ImageAnalyzer:
         """Analyze image properties and recommend encryption method"""
         try:
             # Convert to grayscale for analysis
-            if len(image_array.shape) == 3:
-                gray = np.mean(image_array, axis=2)
-            else:
-                gray = image_array
+            gray = ImageAnalyzer.to_grayscale(image_array)
 
-            # Calculate entropy
-            hist, _ = np.histogram(gray, bins=256)
-            hist = hist / hist.sum()
-            entropy = -np.sum(hist * np.log2(hist + 1e-10))
+            if _analyze_gray is not None:
+                # Fused kernel: one streaming read for all statistics
+                entropy, brightness, contrast, edge_density = _analyze_gray(
+                    np.ascontiguousarray(gray)
+                )
+            else:
+                # Calculate entropy
+                hist, _ = np.histogram(gray, bins=256, range=(0, 256))
+                entropy = ImageAnalyzer.histogram_entropy(hist)
 
-            # Calculate contrast
-            contrast = np.std(gray)
+                # Calculate contrast
+                contrast = np.std(gray)
 
-            # Calculate brightness
-            brightness = np.mean(gray)
+                # Calculate brightness
+                brightness = np.mean(gray)
 
-            # Detect image complexity
-            edges = np.gradient(gray)[0]
-            edge_density = np.count_nonzero(edges > 10) / gray.size
+                # Detect image complexity from vertical neighbour differences
+                diff = np.abs(np.subtract(gray[1:], gray[:-1], dtype=np.int16))
+                edge_density = float(np.count_nonzero(diff > 10)) / gray.size
 
             return {
                 'entropy': float(entropy),
@@ -59,6 +126,52 @@ class ImageAnalyzer:
         except Exception:
             return None
 
+    @staticmethod
+    def to_grayscale(image_array):
+        """Reduce an image array to a single-byte luma plane"""
+        if len(image_array.shape) != 3:
+            gray = image_array
+        elif image_array.shape[2] < 3:
+            gray = image_array[:, :, 0]
+        elif image_array.dtype != np.uint8:
+            gray = np.dot(image_array[:, :, :3].astype(np.float64), LUMA_WEIGHTS / 256)
+        elif cv2 is not None:
+            code = cv2.COLOR_RGBA2GRAY if image_array.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+            return cv2.cvtColor(np.ascontiguousarray(image_array[:, :, :4]), code)
+        else:
+            # Fixed-point fallback: weights sum to 256 so a right shift rescales
+            gray = np.empty(image_array.shape[:2], dtype=np.uint16)
+            np.dot(image_array[:, :, :3].astype(np.uint16, copy=False), LUMA_WEIGHTS, out=gray)
+            gray >>= 8
+            return gray.astype(np.uint8)
+
+        if gray.dtype == np.uint8:
+            return gray
+
+        # 16-bit, 32-bit and float modes (I;16, I, F): stretch the value range
+        # onto 0-255 so the 256-bin statistics and thresholds still apply
+        gray = gray.astype(np.float64)
+        low, high = gray.min(), gray.max()
+        if high == low:
+            return np.zeros(gray.shape, dtype=np.uint8)
+        return ((gray - low) * (255.0 / (high - low))).astype(np.uint8)
+
+    @staticmethod
+    def histogram_entropy(hist):
+        """Shannon entropy in bits of a histogram of counts"""
+        # Empty bins contribute nothing, so skip them instead of adding an epsilon
+        nz = hist[hist > 0] / hist.sum()
+        return -float(np.dot(nz, np.log2(nz)))
+
+    @staticmethod
+    def pixel_entropy(pixels):
+        """Shannon entropy in bits of the pixel value distribution"""
+        if pixels.dtype == np.uint8:
+            hist = np.bincount(pixels.ravel(), minlength=256)
+        else:
+            hist, _ = np.histogram(pixels, bins=256)
+        return ImageAnalyzer.histogram_entropy(hist)
+
     @staticmethod
     def recommend_method(analysis):
         """AI recommendation engine"""
@@ -81,15 +194,53 @@ class ImageAnalyzer:
 
 
 # ============================================================================
-# WORKER THREAD FOR BATCH PROCESSING
+# WORKER THREADS FOR BATCH PROCESSING & METRICS
 # ============================================================================
 
+def _output_path(file, output_dir):
+    """Destination path for an encrypted batch file"""
+    base_name = os.path.basename(file)
+    name, ext = os.path.splitext(base_name)
+    return os.path.join(output_dir, f"{name}_encrypted{ext}")
+
+
+_thread_state = threading.local()
+
+
+def _scratch_for(pixels):
+    """Per-thread working buffer, reused while consecutive images share a shape"""
+    scratch = getattr(_thread_state, 'scratch', None)
+    if scratch is None or scratch.shape != pixels.shape:
+        scratch = np.empty(pixels.shape, dtype=np.uint8)
+        _thread_state.scratch = scratch
+    return scratch
+
+
+def _process_one(file, key, method, output_dir):
+    """Encrypt a single batch file (decode, encrypt, encode)"""
+    # asarray wraps PIL's buffer; the encryption kernel makes the only copy
+    with Image.open(file) as img:
+        pixels = np.asarray(img)
+
+    # Safe to reuse: the result is saved before this thread encrypts again
+    encrypted = encrypt_image_from_array(pixels, key, method, scratch=_scratch_for(pixels))
+
+    output_path = _output_path(file, output_dir)
+    encrypted.save(output_path)
+    return output_path
+
+
 class BatchProcessWorker(QThread):
     """Worker thread for non-blocking batch processing"""
     progress = pyqtSignal(int)
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
 
+    # Decoded/encoded images allowed in flight on the serial path
+    PIPELINE_DEPTH = 2
+    # Upper bound on batch threads; beyond this disk I/O is the bottleneck
+    MAX_WORKERS = 8
+
     def __init__(self, files, key, method):
         super().__init__()
         self.files = files
@@ -101,73 +252,503 @@ class BatchProcessWorker(QThread):
             output_dir = os.path.join(os.getcwd(), 'encrypted_images')
             os.makedirs(output_dir, exist_ok=True)
 
-            for idx, file in enumerate(self.files):
-                img = Image.open(file)
-                encrypted = encrypt_image_from_array(np.array(img), self.key, self.method)
+            workers = min(self.MAX_WORKERS, os.cpu_count() or 1, len(self.files))
+            if USE_GPU:
+                # One device: keep a single GPU stream fed from the I/O pipeline
+                stream = cupy.cuda.Stream(non_blocking=True)
+                self.run_pipelined(
+                    output_dir,
+                    lambda pixels, key, method: _encrypt_gpu(pixels, key, method, stream)
+                )
+            elif workers > 1:
+                self.run_parallel(output_dir, workers)
+            else:
+                self.run_pipelined(output_dir)
+
+            self.finished.emit(f'Successfully processed {len(self.files)} images in {output_dir}')
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def emit_progress(self, done):
+        """Emit overall completion percentage"""
+        self.progress.emit(int(done / len(self.files) * 100))
+
+    def run_parallel(self, output_dir, workers):
+        """Encrypt files across a pool of worker threads"""
+        # Each image is independent, so spread decode/encrypt/encode over cores.
+        # PIL codecs, NumPy ufuncs and the nogil kernels all release the GIL,
+        # so threads scale without process start-up or pickling costs.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_process_one, file, self.key, self.method, output_dir)
+                for file in self.files
+            ]
+
+            try:
+                for idx, future in enumerate(as_completed(futures)):
+                    future.result()
+                    self.emit_progress(idx + 1)
+            except Exception:
+                # Drop queued files instead of finishing the batch before reporting
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    def run_pipelined(self, output_dir, encrypt=None):
+        """Encrypt files serially while decode and save run on helper threads"""
+        encrypt = encrypt or encrypt_image_from_array
+        decoded = queue.Queue(maxsize=self.PIPELINE_DEPTH)
+        encoded = queue.Queue(maxsize=self.PIPELINE_DEPTH)
+        errors = []
+
+        def reader():
+            try:
+                for file in self.files:
+                    if errors:
+                        break
+                    with Image.open(file) as img:
+                        pixels = np.asarray(img)
+                    decoded.put((file, pixels))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                decoded.put(None)
+
+        def writer():
+            done = 0
+            while True:
+                item = encoded.get()
+                if item is None:
+                    break
+                if errors:
+                    continue
+                image, output_path = item
+                try:
+                    image.save(output_path)
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                done += 1
+                self.emit_progress(done)
+
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        writer_thread = threading.Thread(target=writer, daemon=True)
+        reader_thread.start()
+        writer_thread.start()
+
+        try:
+            while True:
+                item = decoded.get()
+                if item is None:
+                    break
+                if errors:
+                    # Keep draining so the reader is never blocked on put()
+                    continue
+                file, pixels = item
+                try:
+                    encrypted = encrypt(pixels, self.key, self.method)
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                encoded.put((encrypted, _output_path(file, output_dir)))
+        finally:
+            encoded.put(None)
+            reader_thread.join()
+            writer_thread.join()
+
+        if errors:
+            raise errors[0]
+
+
+class AnalysisSignals(QObject):
+    """Signals for AnalysisWorker: (token, analysis dict or None on failure)"""
+    done = pyqtSignal(int, object)
+
+
+class AnalysisWorker(QRunnable):
+    """Pool task running ImageAnalyzer on a freshly loaded image"""
+
+    def __init__(self, signals, token, image_array, future):
+        super().__init__()
+        # Owned by the window so it outlives the task that emits on it
+        self.signals = signals
+        self.token = token
+        self.image_array = image_array
+        # Lets the GUI thread wait for this result instead of recomputing it
+        self.future = future
+
+    def run(self):
+        # analyze_image reports failure as None rather than raising
+        analysis = ImageAnalyzer.analyze_image(self.image_array)
+        self.future.set_result(analysis)
+        self.signals.done.emit(self.token, analysis)
 
-                base_name = os.path.basename(file)
-                name, ext = os.path.splitext(base_name)
-                output_path = os.path.join(output_dir, f"{name}_encrypted{ext}")
 
-                encrypted.save(output_path)
+class MetricsSignals(QObject):
+    """Signals for MetricsWorker (QRunnable cannot emit on its own)"""
+    done = pyqtSignal(int, str)
 
-                # Emit progress
-                progress = int((idx + 1) / len(self.files) * 100)
-                self.progress.emit(progress)
 
-            self.finished.emit(f'Successfully processed {len(self.files)} images in {output_dir}')
+class MetricsWorker(QRunnable):
+    """Pool task computing original-vs-result metrics off the GUI thread"""
+
+    # Above this many values, measure every SAMPLE_STRIDE-th row and column only
+    SAMPLE_THRESHOLD = 1_000_000
+    SAMPLE_STRIDE = 4
+
+    def __init__(self, signals, token, orig_array, result_array, processing_time, orig_size, result_size):
+        super().__init__()
+        # Owned by the window so it outlives the task that emits on it
+        self.signals = signals
+        self.token = token
+        self.orig_array = orig_array
+        self.result_array = result_array
+        self.processing_time = processing_time
+        self.orig_size = orig_size
+        self.result_size = result_size
+
+    def run(self):
+        try:
+            orig_array, result_array = self.orig_array, self.result_array
+            approx = orig_array.size > self.SAMPLE_THRESHOLD
+            if approx:
+                # A uniform 1/16 grid keeps MSE and entropy representative
+                step = self.SAMPLE_STRIDE
+                orig_array = orig_array[::step, ::step]
+                result_array = result_array[::step, ::step]
+
+            # ravel() is a view of contiguous arrays; a sampled grid copies 1/16
+            orig_array = orig_array.ravel()
+            result_array = result_array.ravel()
+
+            # MSE, in a signed type so uint8 subtraction cannot wrap
+            diff = np.subtract(orig_array, result_array, dtype=np.float32)
+            mse = np.dot(diff, diff) / diff.size
+
+            # Entropy difference
+            orig_entropy = ImageAnalyzer.pixel_entropy(orig_array)
+            result_entropy = ImageAnalyzer.pixel_entropy(result_array)
+
+            text = (
+                f"⏱️ Processing Time: {self.processing_time:.3f}s\n"
+                f"📊 Mean Squared Error: {mse:.1f}\n"
+                f"🔢 Entropy Increase: {result_entropy - orig_entropy:.2f}\n"
+                f"💾 Original: {self.orig_size[0]}×{self.orig_size[1]}\n"
+                f"🎨 Result: {self.result_size[0]}×{self.result_size[1]}"
+            )
+            if approx:
+                text += f"\n≈ Approximate metrics (1/{self.SAMPLE_STRIDE ** 2} sample)"
         except Exception as e:
-            self.error.emit(str(e))
+            text = f'Metrics error: {str(e)}'
+        self.signals.done.emit(self.token, text)
 
 
 # ============================================================================
 # ENCRYPTION/DECRYPTION FUNCTIONS
 # ============================================================================
 
-def encrypt_image_from_array(pixels, key, method):
-    """Enhanced encryption with multiple methods"""
-    pixels = pixels.astype(np.int16)
-
-    if method == 'swap':
-        if len(pixels.shape) == 3 and pixels.shape[2] >= 3:
-            pixels[:, :, [0, 2]] = pixels[:, :, [2, 0]]
-            pixels[:, :, 1] = (pixels[:, :, 1] + key) % 256
-    elif method == 'xor':
-        pixels = pixels ^ key
-    elif method == 'shift':
-        pixels = np.left_shift(pixels, key % 8) % 256
-    elif method == 'aes':
-        # Simplified AES-like operation using key-based rotation
-        pixels = np.roll(pixels, key, axis=0)
-        pixels = (pixels + key * 3) % 256
-    elif method == 'steganography':
-        # Hide data in least significant bits
-        noise = np.random.randint(0, 2, pixels.shape)
-        pixels = (pixels & 0xFE) | noise
-
-    return Image.fromarray(np.clip(pixels, 0, 255).astype('uint8'))
+# PCG64 stream for steganographic noise
+_rng = np.random.default_rng()
+
+
+def _as_uint8(pixels, scratch=None):
+    """Private uint8 working copy; the caller's array is never mutated"""
+    if pixels.dtype == np.uint8:
+        if scratch is not None and scratch.shape == pixels.shape and scratch.dtype == np.uint8:
+            np.copyto(scratch, pixels)
+            return scratch
+        return np.array(pixels, dtype=np.uint8)
+    return np.clip(pixels, 0, 255).astype(np.uint8)
+
+
+if njit is not None:
+    # Flat byte loops that LLVM vectorises for the host CPU (AVX2/SSE2);
+    # nogil lets batch threads run them concurrently
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _xor_kernel(buf, key):
+        for i in range(buf.size):
+            buf[i] ^= key
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _add_kernel(buf, delta):
+        for i in range(buf.size):
+            buf[i] += delta
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _shift_left_kernel(buf, bits):
+        for i in range(buf.size):
+            buf[i] <<= bits
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _shift_right_kernel(buf, bits):
+        for i in range(buf.size):
+            buf[i] >>= bits
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _swap_kernel(pixels, green_delta):
+        # Red/blue exchange and green offset in one pass over each pixel
+        rows, cols, _ = pixels.shape
+        for i in range(rows):
+            for j in range(cols):
+                red = pixels[i, j, 0]
+                pixels[i, j, 0] = pixels[i, j, 2]
+                pixels[i, j, 2] = red
+                pixels[i, j, 1] += green_delta
+else:
+    _xor_kernel = _add_kernel = None
+    _shift_left_kernel = _shift_right_kernel = _swap_kernel = None
+
+
+def _use_kernel(kernel, pixels):
+    """Numba kernels take C-contiguous uint8 buffers only"""
+    return kernel is not None and pixels.flags.c_contiguous
+
+
+def _xor_u8(pixels, key):
+    xor_k = np.uint8(key & 0xFF)
+    if _use_kernel(_xor_kernel, pixels):
+        _xor_kernel(pixels.reshape(-1), xor_k)
+    else:
+        np.bitwise_xor(pixels, xor_k, out=pixels)
+    return pixels
+
+
+def _add_u8(pixels, delta):
+    # delta is a uint8 scalar; 8-bit addition wraps modulo 256
+    if _use_kernel(_add_kernel, pixels):
+        _add_kernel(pixels.reshape(-1), delta)
+    else:
+        np.add(pixels, delta, out=pixels)
+    return pixels
+
+
+def _shift_left_u8(pixels, key):
+    # uint8 storage drops the high bits, i.e. wraps modulo 256
+    bits = np.uint8(key % 8)
+    if _use_kernel(_shift_left_kernel, pixels):
+        _shift_left_kernel(pixels.reshape(-1), bits)
+    else:
+        np.left_shift(pixels, bits, out=pixels)
+    return pixels
+
+
+def _shift_right_u8(pixels, key):
+    bits = np.uint8(key % 8)
+    if _use_kernel(_shift_right_kernel, pixels):
+        _shift_right_kernel(pixels.reshape(-1), bits)
+    else:
+        np.right_shift(pixels, bits, out=pixels)
+    return pixels
+
+
+def _swap_channels(pixels, green_delta):
+    if len(pixels.shape) == 3 and pixels.shape[2] >= 3:
+        if _use_kernel(_swap_kernel, pixels):
+            _swap_kernel(pixels, green_delta)
+            return pixels
+
+        # Plane copies instead of a fancy-index gather of both channels
+        red = pixels[:, :, 0].copy()
+        pixels[:, :, 0] = pixels[:, :, 2]
+        pixels[:, :, 2] = red
+
+        green = pixels[:, :, 1]
+        green += green_delta
+    return pixels
+
+
+def _roll_offset(pixels, shift, delta):
+    # Rotate rows with two slice copies into a fresh buffer
+    rows = pixels.shape[0]
+    k = shift % rows if rows else 0
+    rolled = np.empty_like(pixels)
+    rolled[:k] = pixels[rows - k:]
+    rolled[k:] = pixels[:rows - k]
+    return _add_u8(rolled, delta)
+
+
+def _stego_embed(pixels, key):
+    # Hide data in least significant bits
+    # Draw one random byte per 8 pixels and unpack it into 0/1 bits
+    n = pixels.size
+    packed = np.frombuffer(_rng.bytes((n + 7) // 8), dtype=np.uint8)
+    noise = np.unpackbits(packed, count=n).reshape(pixels.shape)
+    np.bitwise_and(pixels, np.uint8(0xFE), out=pixels)
+    np.bitwise_or(pixels, noise, out=pixels)
+    return pixels
+
+
+def _stego_extract(pixels, key):
+    # Extract from LSBs - simplified recovery
+    np.bitwise_and(pixels, np.uint8(0xFE), out=pixels)
+    return pixels
+
+
+# Offsets are reduced to uint8 scalars once per call; masking a negative
+# offset yields 256 - offset, so decryption is the same wrapping add.
+
+def _swap_encrypt(pixels, key):
+    return _swap_channels(pixels, np.uint8(key & 0xFF))
+
+
+def _swap_decrypt(pixels, key):
+    return _swap_channels(pixels, np.uint8(-key & 0xFF))
+
+
+def _aes_encrypt(pixels, key):
+    # Simplified AES-like operation using key-based rotation
+    return _roll_offset(pixels, key, np.uint8((key * 3) & 0xFF))
+
+
+def _aes_decrypt(pixels, key):
+    return _roll_offset(pixels, -key, np.uint8(-(key * 3) & 0xFF))
+
+
+def _passthrough(pixels, key):
+    return pixels
+
+
+ENCRYPT_METHODS = {
+    'swap': _swap_encrypt,
+    'xor': _xor_u8,
+    'shift': _shift_left_u8,
+    'aes': _aes_encrypt,
+    'steganography': _stego_embed,
+}
+
+DECRYPT_METHODS = {
+    'swap': _swap_decrypt,
+    'xor': _xor_u8,
+    'shift': _shift_right_u8,
+    'aes': _aes_decrypt,
+    'steganography': _stego_extract,
+}
+
+
+def _warm_up_kernels():
+    """Compile (or load from cache) the pixel kernels before the first click"""
+    sample = np.zeros((1, 1, 3), dtype=np.uint8)
+    for method_fn in list(ENCRYPT_METHODS.values()) + list(DECRYPT_METHODS.values()):
+        method_fn(sample, 1)
+
+
+if njit is not None:
+    _warm_up_kernels()
+
+
+# PIL modes for interleaved uint8 arrays by channel count
+_IMAGE_MODES = {3: 'RGB', 4: 'RGBA'}
+
+
+def _to_image(pixels):
+    """Wrap a uint8 array as a PIL image, skipping fromarray's mode inference"""
+    mode = 'L' if len(pixels.shape) == 2 else _IMAGE_MODES.get(pixels.shape[2])
+    if mode is None:
+        return Image.fromarray(pixels)
+
+    # L and RGBA images reference the buffer directly; RGB is copied by PIL
+    pixels = np.ascontiguousarray(pixels)
+    return Image.frombuffer(mode, (pixels.shape[1], pixels.shape[0]), pixels, 'raw', mode, 0, 1)
+
+
+def encrypt_image_from_array(pixels, key, method, scratch=None):
+    """Enhanced encryption with multiple methods
+
+    A uint8 ``scratch`` array of the same shape is reused as the working copy
+    instead of allocating one; the returned image may share its memory.
+    """
+    method_fn = ENCRYPT_METHODS.get(method, _passthrough)
+    return _to_image(method_fn(_as_uint8(pixels, scratch), key))
 
 
 def decrypt_image_from_array(pixels, key, method):
     """Enhanced decryption with multiple methods"""
-    pixels = pixels.astype(np.int16)
-
-    if method == 'swap':
-        if len(pixels.shape) == 3 and pixels.shape[2] >= 3:
-            pixels[:, :, [0, 2]] = pixels[:, :, [2, 0]]
-            pixels[:, :, 1] = (pixels[:, :, 1] - key) % 256
-    elif method == 'xor':
-        pixels = pixels ^ key
-    elif method == 'shift':
-        pixels = np.right_shift(pixels, key % 8) % 256
-    elif method == 'aes':
-        pixels = np.roll(pixels, -key, axis=0)
-        pixels = (pixels - key * 3) % 256
-    elif method == 'steganography':
-        # Extract from LSBs - simplified recovery
-        pixels = pixels & 0xFE
-
-    return Image.fromarray(np.clip(pixels, 0, 255).astype('uint8'))
+    method_fn = DECRYPT_METHODS.get(method, _passthrough)
+    return _to_image(method_fn(_as_uint8(pixels), key))
+
+
+def _encrypt_gpu(pixels, key, method, stream):
+    """CuPy encryption for batch processing; same output as the CPU methods"""
+    if method not in ('swap', 'xor', 'shift', 'aes'):
+        return encrypt_image_from_array(pixels, key, method)
+    if pixels.dtype != np.uint8:
+        pixels = _as_uint8(pixels)
+
+    with stream:
+        d = cupy.asarray(pixels)
+        if method == 'swap':
+            if len(d.shape) == 3 and d.shape[2] >= 3:
+                d[:, :, [0, 2]] = d[:, :, [2, 0]]
+                d[:, :, 1] += np.uint8(key & 0xFF)
+        elif method == 'xor':
+            d ^= np.uint8(key & 0xFF)
+        elif method == 'shift':
+            d <<= np.uint8(key % 8)
+        elif method == 'aes':
+            d = cupy.roll(d, key, axis=0)
+            d += np.uint8((key * 3) & 0xFF)
+        result = cupy.asnumpy(d, stream=stream)
+        stream.synchronize()
+
+    return _to_image(result)
+
+
+# ============================================================================
+# STYLESHEETS
+# ============================================================================
+
+# Window-wide sheets live in styles/<theme>.qss so they can be edited without
+# touching Python. They are combined into one sheet whose rules are scoped by
+# the window's "theme" property, so switching themes never re-parses QSS.
+# Panels and previews are matched by object name, so one setStyleSheet covers all.
+_STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles')
+
+
+# Comments, and whitespace Qt's tokenizer would otherwise have to scan
+_QSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_QSS_PUNCT_SPACE = re.compile(r'\s*([{};,])\s*')
+_QSS_COLON_SPACE = re.compile(r':\s+')
+_QSS_SPACE = re.compile(r'\s+')
+
+
+def _minify_qss(qss):
+    """Strip comments and redundant whitespace; Qt parses the result identically"""
+    qss = _QSS_COMMENT.sub('', qss)
+    qss = _QSS_SPACE.sub(' ', qss)
+    qss = _QSS_PUNCT_SPACE.sub(r'\1', qss)
+    return _QSS_COLON_SPACE.sub(':', qss).strip()
+
+
+@lru_cache(maxsize=1)
+def _window_style(themes):
+    """One minified sheet holding every theme, each scoped to QMainWindow[theme="<name>"]"""
+    rules = []
+    for theme in themes:
+        with open(os.path.join(_STYLES_DIR, f'{theme}.qss'), encoding='utf-8') as f:
+            qss = _minify_qss(f.read())
+
+        scope = f'QMainWindow[theme="{theme}"]'
+        for rule in qss.split('}'):
+            if not rule:
+                continue
+            selectors, declarations = rule.split('{', 1)
+            scoped = ','.join(
+                scope if selector == 'QMainWindow' else f'{scope} {selector}'
+                for selector in selectors.split(',')
+            )
+            rules.append(f'{scoped}{{{declarations}}}')
+    return ''.join(rules)
+
+
+# Icon fill colour; unlike QPixmap, QColor can be built before QApplication exists
+_ICON_FILL = QColor(50, 184, 198, 0)
+
+
+@lru_cache(maxsize=1)
+def _make_app_icon():
+    """Application icon, rendered once (needs a QApplication, so built lazily)"""
+    icon = QPixmap(64, 64)
+    icon.fill(_ICON_FILL)
+    return QIcon(icon)
 
 
 # ============================================================================
@@ -175,16 +756,73 @@ def decrypt_image_from_array(pixels, key, method):
 # ============================================================================
 
 class CryptaPixelonApp(QMainWindow):
+    # Emitted by the writer thread: (path, error message or '')
+    image_saved = pyqtSignal(str, str)
+
+    # Shared fonts; widgets keep their own copy, so one instance serves all labels
+    FONT_H1 = QFont('Courier New', 12, QFont.Bold)
+    FONT_H2 = QFont('Courier New', 11, QFont.Bold)
+    FONT_LABEL = QFont('Courier New', 10, QFont.Bold)
+    FONT_SMALL = QFont('Courier New', 9)
+    FONT_TINY = QFont('Courier New', 8)
+
+    # Advanced tab slider defaults, also shown before that tab is first built
+    DEFAULT_STRENGTH = 5
+    DEFAULT_QUALITY = 90
+    SLIDER_LABEL_FMT = 'Encryption Strength: %d/10 | Output Quality: %d%%'
+
+    # Theme button captions name the theme a click switches to. Single BMP
+    # symbols, not emoji sequences, so Qt lays them out without font fallback.
+    LIGHT_MODE_LABEL = '☀ Light Mode'
+    DARK_MODE_LABEL = '☾ Dark Mode'
+
+    # Per-theme lookup tables, indexed by the self.dark bool
+    THEME_NAMES = ('light', 'dark')
+    THEME_BUTTON_LABELS = (DARK_MODE_LABEL, LIGHT_MODE_LABEL)
+
+    # Encryption methods in combo-box order, with their status-line blurbs
+    METHOD_DESCRIPTIONS = {
+        'swap': 'Fast, simple channel swapping',
+        'xor': 'Mathematical XOR operation',
+        'shift': 'Bit shifting encryption',
+        'aes': 'Advanced encryption standard',
+        'steganography': 'Hide data in LSBs'
+    }
+
     def __init__(self):
         super().__init__()
         self.current_image = None
         self.result_image = None
-        self.history = []
+        # Pixel arrays of the two images, converted once and shared by all consumers
+        self._current_array = None
+        self._result_array = None
+        # ImageAnalyzer results keyed by id(self.current_image)
+        self._analysis_cache = {}
+        # Bounded undo stack; older states are dropped rather than pinned in memory
+        self.history = deque(maxlen=10)
         self.history_index = -1
-        self.theme = 'dark'
+        self.dark = True
+        # Value of self.dark whose sheet is installed; None until the first apply
+        self._applied_theme = None
         self.batch_worker = None
+        # Only the newest metrics job may update the label
+        self.metrics_signals = MetricsSignals()
+        self.metrics_signals.done.connect(self.on_metrics_done)
+        self._metrics_token = 0
+        # Likewise, only the analysis of the newest loaded image is shown
+        self.analysis_signals = AnalysisSignals()
+        self.analysis_signals.done.connect(self.on_analysis_done)
+        self._analysis_token = 0
+        # Result of the analysis running for the current image, if any
+        self._analysis_future = None
         self.processing_time = 0
 
+        # Single background writer so PNG/JPG encoding never blocks the UI
+        self._write_queue = queue.Queue()
+        self.image_saved.connect(self.on_image_saved)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
         self.initUI()
         self.setWindowIcon(self.create_app_icon())
 
@@ -193,8 +831,7 @@ class CryptaPixelonApp(QMainWindow):
         self.setWindowTitle('CryptaPixelon - Advanced AI Edition')
         self.setGeometry(100, 100, 1400, 900)
 
-        # Apply theme
-        self.apply_theme()
+        # The theme sheet is applied on first show (see showEvent)
 
         # Create central widget and main layout
         central_widget = QWidget()
@@ -225,17 +862,17 @@ class CryptaPixelonApp(QMainWindow):
 
         # Status bar
         self.statusBar().showMessage('Ready')
-        self.statusBar().setStyleSheet("color: #32b8c6; font-weight: bold;")
 
     def create_left_panel(self):
         """Create left panel with image upload and preview"""
         panel = QFrame()
+        panel.setObjectName('panel')
         layout = QVBoxLayout(panel)
         layout.setSpacing(10)
 
         # Header
         title = QLabel('📸 Image Source')
-        title.setFont(QFont('Courier New', 12, QFont.Bold))
+        title.setFont(self.FONT_H1)
         layout.addWidget(title)
 
         # Upload button
@@ -249,7 +886,7 @@ class CryptaPixelonApp(QMainWindow):
         self.upload_label = QLabel('Drop image here\nor click upload')
         self.upload_label.setAlignment(Qt.AlignCenter)
         self.upload_label.setMinimumSize(300, 250)
-        self.upload_label.setStyleSheet(self.get_preview_style())
+        self.upload_label.setObjectName('preview')
         self.upload_label.setAcceptDrops(True)
         self.upload_label.dragEnterEvent = self.drag_enter_event
         self.upload_label.dropEvent = self.drop_event
@@ -257,7 +894,7 @@ class CryptaPixelonApp(QMainWindow):
 
         # Image info display
         self.image_info = QLabel('No image loaded')
-        self.image_info.setFont(QFont('Courier New', 9))
+        self.image_info.setFont(self.FONT_SMALL)
         self.image_info.setWordWrap(True)
         layout.addWidget(self.image_info)
 
@@ -265,37 +902,39 @@ class CryptaPixelonApp(QMainWindow):
         self.analysis_group = QGroupBox('🤖 AI Analysis')
         analysis_layout = QVBoxLayout()
         self.analysis_text = QLabel('Upload image for analysis')
-        self.analysis_text.setFont(QFont('Courier New', 9))
+        self.analysis_text.setFont(self.FONT_SMALL)
         self.analysis_text.setWordWrap(True)
         analysis_layout.addWidget(self.analysis_text)
         self.analysis_group.setLayout(analysis_layout)
         layout.addWidget(self.analysis_group)
 
         layout.addStretch()
-        panel.setStyleSheet(self.get_panel_style())
         return panel
 
     def create_center_panel(self):
         """Create center panel with controls"""
         panel = QFrame()
+        panel.setObjectName('panel')
         layout = QVBoxLayout(panel)
         layout.setSpacing(12)
 
         # Tab widget for different control sections
         tabs = QTabWidget()
-        tabs.setStyleSheet(self.get_tab_style())
 
         # Tab 1: Encryption Controls
         encrypt_tab = self.create_encryption_tab()
         tabs.addTab(encrypt_tab, '🔐 Encryption')
 
-        # Tab 2: Batch Processing
-        batch_tab = self.create_batch_tab()
-        tabs.addTab(batch_tab, '⚡ Batch')
-
-        # Tab 3: Advanced Settings
-        advanced_tab = self.create_advanced_tab()
-        tabs.addTab(advanced_tab, '⚙️ Advanced')
+        # Tabs 2 and 3 (Batch Processing, Advanced Settings) start as empty
+        # placeholders and are filled in the first time they are opened
+        self._lazy_tabs = {}
+        for builder, title in ((self.create_batch_tab, '⚡ Batch'),
+                               (self.create_advanced_tab, '⚙️ Advanced')):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self._lazy_tabs[tabs.addTab(placeholder, title)] = (placeholder, builder)
+        tabs.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(tabs)
 
@@ -318,11 +957,10 @@ class CryptaPixelonApp(QMainWindow):
         layout.addLayout(button_layout)
 
         # Theme toggle
-        self.theme_btn = QPushButton('🌙 Dark Mode')
+        self.theme_btn = QPushButton(self.THEME_BUTTON_LABELS[self.dark])
         self.theme_btn.clicked.connect(self.toggle_theme)
         layout.addWidget(self.theme_btn)
 
-        panel.setStyleSheet(self.get_panel_style())
         return panel
 
     def create_encryption_tab(self):
@@ -333,11 +971,11 @@ class CryptaPixelonApp(QMainWindow):
 
         # Method selection
         method_label = QLabel('Encryption Method:')
-        method_label.setFont(QFont('Courier New', 10, QFont.Bold))
+        method_label.setFont(self.FONT_LABEL)
         layout.addWidget(method_label)
 
         self.method_combo = QComboBox()
-        self.method_combo.addItems(['swap', 'xor', 'shift', 'aes', 'steganography'])
+        self.method_combo.addItems(list(self.METHOD_DESCRIPTIONS))
         self.method_combo.setMinimumHeight(35)
         self.method_combo.currentTextChanged.connect(self.on_method_changed)
         layout.addWidget(self.method_combo)
@@ -349,14 +987,18 @@ class CryptaPixelonApp(QMainWindow):
 
         # Key input
         key_label = QLabel('Encryption Key:')
-        key_label.setFont(QFont('Courier New', 10, QFont.Bold))
+        key_label.setFont(self.FONT_LABEL)
         layout.addWidget(key_label)
 
         key_layout = QHBoxLayout()
         self.key_input = QLineEdit()
         self.key_input.setPlaceholderText('Enter key (1-255)')
         self.key_input.setMinimumHeight(35)
-        self.key_input.textChanged.connect(self.update_key_strength)
+        # Coalesce keystrokes: refresh the strength bar once typing pauses
+        self._key_timer = QTimer(self, singleShot=True)
+        self._key_timer.setInterval(100)
+        self._key_timer.timeout.connect(self._do_update_key_strength)
+        self.key_input.textChanged.connect(self._key_timer.start)
         key_layout.addWidget(self.key_input)
 
         self.smart_key_btn = QPushButton('🎲')
@@ -369,12 +1011,14 @@ class CryptaPixelonApp(QMainWindow):
 
         # Key strength indicator
         self.key_strength = QLabel('Key Strength: -')
-        self.key_strength.setFont(QFont('Courier New', 9))
+        self.key_strength.setFont(self.FONT_SMALL)
         layout.addWidget(self.key_strength)
 
         # Processing info (also used for slider value text)
-        self.processing_info = QLabel('')
-        self.processing_info.setFont(QFont('Courier New', 9))
+        self.processing_info = QLabel(
+            self.SLIDER_LABEL_FMT % (self.DEFAULT_STRENGTH, self.DEFAULT_QUALITY)
+        )
+        self.processing_info.setFont(self.FONT_SMALL)
         layout.addWidget(self.processing_info)
 
         # Main action buttons
@@ -396,6 +1040,13 @@ class CryptaPixelonApp(QMainWindow):
 
         return widget
 
+    def _ensure_tab_built(self, index):
+        """Build a lazily created tab the first time it is shown"""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is not None:
+            placeholder, builder = entry
+            placeholder.layout().addWidget(builder())
+
     def create_batch_tab(self):
         """Create batch processing tab"""
         widget = QWidget()
@@ -403,11 +1054,11 @@ class CryptaPixelonApp(QMainWindow):
         layout.setSpacing(12)
 
         title = QLabel('⚡ Batch Processing')
-        title.setFont(QFont('Courier New', 11, QFont.Bold))
+        title.setFont(self.FONT_H2)
         layout.addWidget(title)
 
         info = QLabel('Process multiple images at once with same settings')
-        info.setFont(QFont('Courier New', 9))
+        info.setFont(self.FONT_SMALL)
         info.setWordWrap(True)
         layout.addWidget(info)
 
@@ -424,7 +1075,7 @@ class CryptaPixelonApp(QMainWindow):
 
         # Batch info
         self.batch_info = QLabel('No batch operation running')
-        self.batch_info.setFont(QFont('Courier New', 9))
+        self.batch_info.setFont(self.FONT_SMALL)
         self.batch_info.setWordWrap(True)
         layout.addWidget(self.batch_info)
 
@@ -437,15 +1088,23 @@ class CryptaPixelonApp(QMainWindow):
         layout = QVBoxLayout(widget)
         layout.setSpacing(12)
 
+        # Slider drags repaint the value label at most once per frame (~16 ms);
+        # the label is built from these plain ints, not read back from Qt
+        self._strength = self.DEFAULT_STRENGTH
+        self._quality = self.DEFAULT_QUALITY
+        self._label_timer = QTimer(self, singleShot=True)
+        self._label_timer.setInterval(16)
+        self._label_timer.timeout.connect(self._flush_slider_label)
+
         # Encryption strength slider
         strength_label = QLabel('Encryption Strength:')
-        strength_label.setFont(QFont('Courier New', 10, QFont.Bold))
+        strength_label.setFont(self.FONT_LABEL)
         layout.addWidget(strength_label)
 
         self.strength_slider = QSlider(Qt.Horizontal)
         self.strength_slider.setMinimum(1)
         self.strength_slider.setMaximum(10)
-        self.strength_slider.setValue(5)
+        self.strength_slider.setValue(self.DEFAULT_STRENGTH)
         self.strength_slider.setTickPosition(QSlider.TicksBelow)
         layout.addWidget(self.strength_slider)
 
@@ -454,13 +1113,13 @@ class CryptaPixelonApp(QMainWindow):
 
         # Quality preservation
         quality_label = QLabel('Output Quality:')
-        quality_label.setFont(QFont('Courier New', 10, QFont.Bold))
+        quality_label.setFont(self.FONT_LABEL)
         layout.addWidget(quality_label)
 
         self.quality_slider = QSlider(Qt.Horizontal)
         self.quality_slider.setMinimum(50)
         self.quality_slider.setMaximum(100)
-        self.quality_slider.setValue(90)
+        self.quality_slider.setValue(self.DEFAULT_QUALITY)
         self.quality_slider.setTickPosition(QSlider.TicksBelow)
         layout.addWidget(self.quality_slider)
 
@@ -476,7 +1135,7 @@ class CryptaPixelonApp(QMainWindow):
 
         # Export options
         export_label = QLabel('Export Settings:')
-        export_label.setFont(QFont('Courier New', 10, QFont.Bold))
+        export_label.setFont(self.FONT_LABEL)
         layout.addWidget(export_label)
 
         export_layout = QGridLayout()
@@ -495,35 +1154,31 @@ class CryptaPixelonApp(QMainWindow):
 
         layout.addLayout(export_layout)
         layout.addStretch()
-
-        # initialize labels once
-        self.update_strength_label(self.strength_slider.value())
-        self.update_quality_label(self.quality_slider.value())
-
         return widget
 
     def create_right_panel(self):
         """Create right panel with results and history"""
         panel = QFrame()
+        panel.setObjectName('panel')
         layout = QVBoxLayout(panel)
         layout.setSpacing(10)
 
         # Results section
         title = QLabel('🎨 Results')
-        title.setFont(QFont('Courier New', 12, QFont.Bold))
+        title.setFont(self.FONT_H1)
         layout.addWidget(title)
 
         self.result_label = QLabel('Result will appear here')
         self.result_label.setAlignment(Qt.AlignCenter)
         self.result_label.setMinimumSize(300, 250)
-        self.result_label.setStyleSheet(self.get_preview_style())
+        self.result_label.setObjectName('preview')
         layout.addWidget(self.result_label)
 
         # Comparison metrics
         self.metrics_group = QGroupBox('📊 Metrics')
         metrics_layout = QVBoxLayout()
         self.metrics_text = QLabel('Metrics will appear after processing')
-        self.metrics_text.setFont(QFont('Courier New', 8))
+        self.metrics_text.setFont(self.FONT_TINY)
         self.metrics_text.setWordWrap(True)
         metrics_layout.addWidget(self.metrics_text)
         self.metrics_group.setLayout(metrics_layout)
@@ -531,7 +1186,7 @@ class CryptaPixelonApp(QMainWindow):
 
         # History panel
         history_title = QLabel('📜 Operation History')
-        history_title.setFont(QFont('Courier New', 10, QFont.Bold))
+        history_title.setFont(self.FONT_LABEL)
         layout.addWidget(history_title)
 
         self.history_list = QListWidget()
@@ -539,7 +1194,6 @@ class CryptaPixelonApp(QMainWindow):
         self.history_list.itemClicked.connect(self.on_history_click)
         layout.addWidget(self.history_list)
 
-        panel.setStyleSheet(self.get_panel_style())
         return panel
 
     # ========================= CORE FUNCTIONALITY ==========================
@@ -555,10 +1209,24 @@ class CryptaPixelonApp(QMainWindow):
     def load_image(self, path):
         """Load and display image"""
         try:
-            self.current_image = Image.open(path)
-
-            # Display preview
-            pixmap = QPixmap(path).scaled(300, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Decode fully before touching state so a bad file keeps the old image
+            image = Image.open(path)
+            array = np.asarray(image)
+            self.current_image = image
+            self._current_array = array
+            self._analysis_cache.clear()
+
+            # Display preview, reusing the cached thumbnail for unchanged files
+            cache_key = f'preview:{path}:{os.path.getmtime(path)}'
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is None:
+                # Decode straight to label size
+                reader = QImageReader(path)
+                size = reader.size()
+                size.scale(QSize(300, 250), Qt.KeepAspectRatio)
+                reader.setScaledSize(size)
+                pixmap = QPixmap.fromImage(reader.read())
+                QPixmapCache.insert(cache_key, pixmap)
             self.upload_label.setPixmap(pixmap)
 
             # Show image info
@@ -569,7 +1237,7 @@ class CryptaPixelonApp(QMainWindow):
                 f"💾 {size:.1f}KB"
             )
 
-            # Run AI analysis
+            # Run AI analysis in the background
             self.analyze_image()
 
             self.statusBar().showMessage(f'✓ Image loaded: {os.path.basename(path)}')
@@ -578,22 +1246,46 @@ class CryptaPixelonApp(QMainWindow):
             QMessageBox.critical(self, 'Error', f'Failed to load image: {str(e)}')
 
     def analyze_image(self):
-        """Run AI analysis on current image"""
-        try:
-            image_array = np.array(self.current_image)
-            analysis = ImageAnalyzer.analyze_image(image_array)
+        """Run AI analysis on current image on a pool thread"""
+        self._analysis_token += 1
+        self._analysis_future = Future()
+        self.analysis_text.setText('Analyzing...')
+        worker = AnalysisWorker(
+            self.analysis_signals, self._analysis_token, self._current_array, self._analysis_future
+        )
+        QThreadPool.globalInstance().start(worker)
 
-            if analysis:
-                recommended = ImageAnalyzer.recommend_method(analysis)
+    def on_analysis_done(self, token, analysis):
+        """Cache and show the analysis unless another image was loaded since"""
+        if token != self._analysis_token:
+            return
 
-                self.analysis_text.setText(
-                    f"Entropy: {analysis['entropy']:.2f}\n"
-                    f"Contrast: {analysis['contrast']:.1f}\n"
-                    f"Complexity: {analysis['complexity']}\n"
-                    f"🤖 Recommended: {recommended.upper()}"
-                )
-        except Exception as e:
-            self.analysis_text.setText(f'Analysis failed: {str(e)}')
+        if analysis is None:
+            self.analysis_text.setText('Analysis failed')
+            return
+
+        self._analysis_cache[id(self.current_image)] = analysis
+        recommended = ImageAnalyzer.recommend_method(analysis)
+
+        self.analysis_text.setText(
+            f"Entropy: {analysis['entropy']:.2f}\n"
+            f"Contrast: {analysis['contrast']:.1f}\n"
+            f"Complexity: {analysis['complexity']}\n"
+            f"🤖 Recommended: {recommended.upper()}"
+        )
+
+    def get_analysis(self):
+        """Analysis of the current image, computed once per loaded image"""
+        key = id(self.current_image)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            if self._analysis_future is not None:
+                # Wait for the load-time worker rather than run a second pass
+                analysis = self._analysis_future.result()
+            else:
+                analysis = ImageAnalyzer.analyze_image(self._current_array)
+            self._analysis_cache[key] = analysis
+        return analysis
 
     def recommend_method(self):
         """Apply AI recommended encryption method"""
@@ -602,8 +1294,7 @@ class CryptaPixelonApp(QMainWindow):
             return
 
         try:
-            image_array = np.array(self.current_image)
-            analysis = ImageAnalyzer.analyze_image(image_array)
+            analysis = self.get_analysis()
             recommended = ImageAnalyzer.recommend_method(analysis)
 
             self.method_combo.setCurrentText(recommended)
@@ -622,8 +1313,7 @@ class CryptaPixelonApp(QMainWindow):
             return
 
         try:
-            image_array = np.array(self.current_image)
-            analysis = ImageAnalyzer.analyze_image(image_array)
+            analysis = self.get_analysis()
             base_key = random.randint(1, 255)
             smart_key = ImageAnalyzer.generate_smart_key(analysis, base_key)
 
@@ -637,7 +1327,7 @@ class CryptaPixelonApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Key generation failed: {str(e)}')
 
-    def update_key_strength(self):
+    def _do_update_key_strength(self):
         """Update key strength indicator"""
         try:
             key = int(self.key_input.text())
@@ -648,17 +1338,21 @@ class CryptaPixelonApp(QMainWindow):
         except Exception:
             self.key_strength.setText('Key Strength: Invalid')
 
+    def _get_key_or_warn(self):
+        """Parse and range-check the key input; warn and return None if invalid"""
+        try:
+            key = int(self.key_input.text())
+            if not (1 <= key <= 255):
+                raise ValueError('Key must be between 1 and 255.')
+        except ValueError as e:
+            QMessageBox.warning(self, 'Invalid Key', f'Please enter a valid key.\n{str(e)}')
+            return None
+        return key
+
     def on_method_changed(self):
         """Handle method change"""
         method = self.method_combo.currentText()
-        descriptions = {
-            'swap': 'Fast, simple channel swapping',
-            'xor': 'Mathematical XOR operation',
-            'shift': 'Bit shifting encryption',
-            'aes': 'Advanced encryption standard',
-            'steganography': 'Hide data in LSBs'
-        }
-        self.processing_info.setText(f'Method: {descriptions.get(method, "")}')
+        self.processing_info.setText(f'Method: {self.METHOD_DESCRIPTIONS.get(method, "")}')
 
     def encrypt(self):
         """Encrypt the image"""
@@ -666,12 +1360,8 @@ class CryptaPixelonApp(QMainWindow):
             QMessageBox.warning(self, 'No Image', 'Please upload an image first.')
             return
 
-        try:
-            key = int(self.key_input.text())
-            if not (1 <= key <= 255):
-                raise ValueError('Key must be between 1 and 255.')
-        except ValueError as e:
-            QMessageBox.warning(self, 'Invalid Key', f'Please enter a valid key.\n{str(e)}')
+        key = self._get_key_or_warn()
+        if key is None:
             return
 
         method = self.method_combo.currentText()
@@ -679,14 +1369,14 @@ class CryptaPixelonApp(QMainWindow):
         try:
             start_time = time.time()
 
-            # Save to history
+            # Save to history; the cached array is never mutated, so no copy
             self.history.append({
-                'image': self.current_image.copy(),
+                'array': self._current_array,
                 'operation': 'original'
             })
 
             # Encrypt
-            self.result_image = encrypt_image_from_array(np.array(self.current_image), key, method)
+            self.set_result_image(encrypt_image_from_array(self._current_array, key, method))
 
             self.processing_time = time.time() - start_time
 
@@ -707,18 +1397,14 @@ class CryptaPixelonApp(QMainWindow):
     def decrypt(self):
         """Decrypt the image"""
         if not self.result_image and self.current_image:
-           self.result_image = self.current_image.copy()
+            self.set_result_image(self.current_image.copy(), self._current_array)
         
         if not self.result_image:
             QMessageBox.warning(self, 'No Result', 'Please encrypt an image first.')
             return
 
-        try:
-            key = int(self.key_input.text())
-            if not (1 <= key <= 255):
-                raise ValueError('Key must be between 1 and 255.')
-        except ValueError as e:
-            QMessageBox.warning(self, 'Invalid Key', f'Please enter a valid key.\n{str(e)}')
+        key = self._get_key_or_warn()
+        if key is None:
             return
 
         method = self.method_combo.currentText()
@@ -726,14 +1412,14 @@ class CryptaPixelonApp(QMainWindow):
         try:
             start_time = time.time()
 
-            # Save to history
+            # Save to history; the cached array is never mutated, so no copy
             self.history.append({
-                'image': self.result_image.copy(),
+                'array': self._result_array,
                 'operation': f'encrypted_{method}'
             })
 
             # Decrypt
-            self.result_image = decrypt_image_from_array(np.array(self.result_image), key, method)
+            self.set_result_image(decrypt_image_from_array(self._result_array, key, method))
 
             self.processing_time = time.time() - start_time
 
@@ -760,12 +1446,8 @@ class CryptaPixelonApp(QMainWindow):
         if not files:
             return
 
-        try:
-            key = int(self.key_input.text())
-            if not (1 <= key <= 255):
-                raise ValueError('Key must be between 1 and 255.')
-        except ValueError as e:
-            QMessageBox.warning(self, 'Invalid Key', f'Please enter a valid key.\n{str(e)}')
+        key = self._get_key_or_warn()
+        if key is None:
             return
 
         method = self.method_combo.currentText()
@@ -799,70 +1481,77 @@ class CryptaPixelonApp(QMainWindow):
         self.batch_info.setText(f'Error: {error}')
         QMessageBox.critical(self, 'Batch Error', error)
 
+    def set_result_image(self, image, array=None):
+        """Set the result image and cache its pixel array"""
+        self.result_image = image
+        self._result_array = np.asarray(image) if array is None else array
+
     def display_result(self):
         """Display result image"""
-        temp_path = '/tmp/result.png'
-        self.result_image.save(temp_path)
-        pixmap = QPixmap(temp_path).scaled(300, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Shrink to preview size first so only label-sized pixels are converted
+        preview = self.result_image.copy()
+        preview.thumbnail((300, 250), Image.BILINEAR)
+
+        # Hand the raw pixels to Qt directly instead of a PNG round-trip via /tmp;
+        # `data` must outlive the QImage, which only wraps it
+        image = preview.convert('RGBA')
+        data = image.tobytes('raw', 'RGBA')
+        qimage = QImage(data, image.width, image.height, image.width * 4, QImage.Format_RGBA8888)
+        pixmap = QPixmap.fromImage(qimage).scaled(300, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.result_label.setPixmap(pixmap)
 
     def update_metrics(self):
-        """Calculate and display metrics"""
-        try:
-            if self.current_image and self.result_image:
-                orig_array = np.array(self.current_image).flatten()
-                result_array = np.array(self.result_image).flatten()
-
-                # MSE
-                mse = np.mean((orig_array - result_array) ** 2)
-
-                # Entropy difference
-                orig_hist, _ = np.histogram(orig_array, bins=256)
-                result_hist, _ = np.histogram(result_array, bins=256)
-
-                orig_hist = orig_hist / orig_hist.sum()
-                result_hist = result_hist / result_hist.sum()
-
-                orig_entropy = -np.sum(orig_hist * np.log2(orig_hist + 1e-10))
-                result_entropy = -np.sum(result_hist * np.log2(result_hist + 1e-10))
+        """Calculate and display metrics on a pool thread"""
+        if self.current_image and self.result_image:
+            self._metrics_token += 1
+            worker = MetricsWorker(
+                self.metrics_signals, self._metrics_token, self._current_array, self._result_array,
+                self.processing_time, self.current_image.size, self.result_image.size
+            )
+            QThreadPool.globalInstance().start(worker)
 
-                self.metrics_text.setText(
-                    f"⏱️ Processing Time: {self.processing_time:.3f}s\n"
-                    f"📊 Mean Squared Error: {mse:.1f}\n"
-                    f"🔢 Entropy Increase: {result_entropy - orig_entropy:.2f}\n"
-                    f"💾 Original: {self.current_image.size[0]}×{self.current_image.size[1]}\n"
-                    f"🎨 Result: {self.result_image.size[0]}×{self.result_image.size[1]}"
-                )
-        except Exception as e:
-            self.metrics_text.setText(f'Metrics error: {str(e)}')
+    def on_metrics_done(self, token, text):
+        """Show metrics unless a newer computation has been started"""
+        if token == self._metrics_token:
+            self.metrics_text.setText(text)
 
     def add_history_item(self, operation, image):
         """Add item to operation history"""
         timestamp = datetime.now().strftime('%H:%M:%S')
         item_text = f'{timestamp} - {operation}'
 
+        # The image and its cached array share one pixel buffer, and the list is
+        # capped at 10 entries, so every entry stays fully restorable
         item = QListWidgetItem(item_text)
-        item.setData(Qt.UserRole, image)
-        self.history_list.insertItem(0, item)
+        item.setData(Qt.UserRole, {'image': image, 'array': self._result_array})
+        # Insert and trim under one repaint
+        self.history_list.setUpdatesEnabled(False)
+        try:
+            self.history_list.insertItem(0, item)
 
-        # Limit history to 10 items
-        if self.history_list.count() > 10:
-            self.history_list.takeItem(self.history_list.count() - 1)
+            # Limit history to 10 items
+            if self.history_list.count() > 10:
+                self.history_list.takeItem(self.history_list.count() - 1)
+        finally:
+            self.history_list.setUpdatesEnabled(True)
 
     def on_history_click(self, item):
         """Restore image from history"""
-        image = item.data(Qt.UserRole)
-        if isinstance(image, Image.Image):
-            self.result_image = image
-            self.display_result()
-            self.statusBar().showMessage('✓ Restored from history')
+        entry = item.data(Qt.UserRole)
+        if not isinstance(entry, dict):
+            return
+
+        self.set_result_image(entry['image'], entry['array'])
+        self.display_result()
+        self.statusBar().showMessage('✓ Restored from history')
 
     def undo(self):
         """Undo last operation"""
         if self.history:
             self.history.pop()
             if self.history:
-                self.result_image = Image.fromarray(np.array(self.history[-1]['image']))
+                array = self.history[-1]['array']
+                self.set_result_image(Image.fromarray(array), array)
                 self.display_result()
                 self.statusBar().showMessage('✓ Undo complete')
         else:
@@ -883,17 +1572,29 @@ class CryptaPixelonApp(QMainWindow):
         if reply == QMessageBox.Yes:
             self.current_image = None
             self.result_image = None
-            self.history = []
-            self.upload_label.setPixmap(QPixmap())
-            self.upload_label.setText('Drop image here\nor click upload')
-            self.result_label.setPixmap(QPixmap())
-            self.result_label.setText('Result will appear here')
-            self.key_input.clear()
-            self.method_combo.setCurrentIndex(0)
-            self.history_list.clear()
-            self.metrics_text.setText('Metrics will appear after processing')
-            self.analysis_text.setText('Upload image for analysis')
-            self.image_info.setText('No image loaded')
+            self._current_array = None
+            self._result_array = None
+            self._analysis_cache.clear()
+            # Drop any analysis still running for the cleared image
+            self._analysis_token += 1
+            self._analysis_future = None
+            self.history.clear()
+
+            # Reset every widget under a single repaint
+            self.setUpdatesEnabled(False)
+            try:
+                self.upload_label.setPixmap(QPixmap())
+                self.upload_label.setText('Drop image here\nor click upload')
+                self.result_label.setPixmap(QPixmap())
+                self.result_label.setText('Result will appear here')
+                self.key_input.clear()
+                self.method_combo.setCurrentIndex(0)
+                self.history_list.clear()
+                self.metrics_text.setText('Metrics will appear after processing')
+                self.analysis_text.setText('Upload image for analysis')
+                self.image_info.setText('No image loaded')
+            finally:
+                self.setUpdatesEnabled(True)
             self.statusBar().showMessage('✓ All data cleared')
 
     def save_image(self):
@@ -908,12 +1609,29 @@ class CryptaPixelonApp(QMainWindow):
         )
 
         if file_path:
+            self._write_queue.put((self.result_image, file_path))
+            self.statusBar().showMessage(f'Saving {os.path.basename(file_path)}...')
+
+    def _writer_loop(self):
+        """Drain queued (image, path) saves until the None sentinel"""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            image, file_path = item
             try:
-                self.result_image.save(file_path)
-                QMessageBox.information(self, 'Saved', f'Image saved successfully!\n{file_path}')
-                self.statusBar().showMessage(f'✓ Image saved: {os.path.basename(file_path)}')
+                image.save(file_path)
+                self.image_saved.emit(file_path, '')
             except Exception as e:
-                QMessageBox.critical(self, 'Error', f'Failed to save: {str(e)}')
+                self.image_saved.emit(file_path, str(e))
+
+    def on_image_saved(self, file_path, error):
+        """Report the outcome of a background save"""
+        if error:
+            QMessageBox.critical(self, 'Error', f'Failed to save: {error}')
+            return
+        QMessageBox.information(self, 'Saved', f'Image saved successfully!\n{file_path}')
+        self.statusBar().showMessage(f'✓ Image saved: {os.path.basename(file_path)}')
 
     def export_report(self):
         """Export detailed encryption report"""
@@ -959,7 +1677,7 @@ Compressed: {'Yes' if self.compress_check.isChecked() else 'No'}
 ═══════════════════════════════════════════════════════════════
 Generated by CryptaPixelon - Advanced AI Edition
 """
-                with open(file_path, 'w') as f:
+                with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(report)
 
                 QMessageBox.information(self, 'Saved', f'Report saved successfully!\n{file_path}')
@@ -979,14 +1697,18 @@ Generated by CryptaPixelon - Advanced AI Edition
 
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write('PIXEL ENCRYPTOR - OPERATION LOG\n')
-                    f.write(f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-                    f.write('=' * 50 + '\n\n')
+                lines = [
+                    'PIXEL ENCRYPTOR - OPERATION LOG\n',
+                    f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n',
+                    '=' * 50 + '\n\n',
+                ]
+                lines.extend(
+                    f'{i+1}. {self.history_list.item(i).text()}\n'
+                    for i in range(self.history_list.count())
+                )
 
-                    for i in range(self.history_list.count()):
-                        item = self.history_list.item(i)
-                        f.write(f'{i+1}. {item.text()}\n')
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
 
                 QMessageBox.information(self, 'Saved', f'Log exported successfully!\n{file_path}')
                 self.statusBar().showMessage('✓ Log exported')
@@ -995,252 +1717,86 @@ Generated by CryptaPixelon - Advanced AI Edition
 
     def drag_enter_event(self, event):
         """Handle drag enter"""
-        if event.mimeData().hasUrls():
-            event.accept()
-        else:
-            event.ignore()
+        event.setAccepted(event.mimeData().hasUrls())
 
     def drop_event(self, event):
         """Handle file drop"""
         urls = event.mimeData().urls()
-        if urls:
-            file_path = urls[0].toLocalFile()
-            if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                self.load_image(file_path)
-            else:
-                QMessageBox.warning(self, 'Invalid File', 'Please drop a valid image file.')
+        if not urls:
+            return
+
+        file_path = urls[0].toLocalFile()
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext in _IMG_EXTS:
+            self.load_image(file_path)
+        else:
+            QMessageBox.warning(self, 'Invalid File', 'Please drop a valid image file.')
+
+    def showEvent(self, event):
+        """Install the theme sheet before the first paint rather than during construction"""
+        # apply_theme is a no-op once the current theme is installed
+        self.apply_theme()
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        """Let pool tasks and queued saves finish before the window goes away"""
+        QThreadPool.globalInstance().waitForDone()
+        self._write_queue.put(None)
+        self._writer.join()
+        super().closeEvent(event)
 
     # ============================== THEME / STYLE ===========================
 
     def toggle_theme(self):
         """Toggle between dark and light theme"""
-        self.theme = 'light' if self.theme == 'dark' else 'dark'
-        self.apply_theme()
-        self.theme_btn.setText('☀️ Light Mode' if self.theme == 'dark' else '🌙 Dark Mode')
+        # Restyle and relabel behind a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.dark = not self.dark
+            self.apply_theme()
+            self.theme_btn.setText(self.THEME_BUTTON_LABELS[self.dark])
+        finally:
+            self.setUpdatesEnabled(True)
 
     def apply_theme(self):
         """Apply current theme"""
-        if self.theme == 'dark':
-            dark_stylesheet = """
-                QMainWindow, QWidget, QFrame { background: #0f1419; color: #ffffff; }
-                QLabel { color: #ffffff; }
-
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #1a3a5c, stop:1 #0f2438);
-                    color: #ffffff;
-                    border: 2px solid #32b8c6;
-                    border-radius: 8px;
-                    padding: 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #32b8c6, stop:1 #1a3a5c);
-                }
-
-                QLineEdit, QComboBox, QSpinBox {
-                    background: #1a2635;
-                    color: #ffffff;
-                    border: 1px solid #32b8c6;
-                    border-radius: 5px;
-                    padding: 5px;
-                }
-
-                QProgressBar { border: 1px solid #32b8c6; background: #1a2635; }
-                QProgressBar::chunk { background: #32b8c6; }
-
-                QTabWidget::pane { border: 1px solid #32b8c6; }
-                QTabBar::tab { background: #1a2635; color: #ffffff; padding: 5px 20px; }
-                QTabBar::tab:selected { background: #32b8c6; }
-
-                QGroupBox {
-                    color: #32b8c6;
-                    border: 1px solid #32b8c6;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-
-                QListWidget {
-                    background: #1a2635;
-                    color: #ffffff;
-                    border: 1px solid #32b8c6;
-                }
-
-                QScrollBar:vertical { background: #1a2635; }
-                QScrollBar::handle:vertical { background: #32b8c6; border-radius: 5px; }
-
-                /* 🔹 SLIDERS – DARK MODE */
-                QSlider::groove:horizontal {
-                    border: 1px solid #32b8c6;
-                    height: 8px;
-                    background: #101b29;
-                    border-radius: 4px;
-                }
-                QSlider::sub-page:horizontal {
-                    background: #32b8c6;
-                    border: 1px solid #32b8c6;
-                    height: 8px;
-                    border-radius: 4px;
-                }
-                QSlider::add-page:horizontal {
-                    background: #06101f;
-                    border: 1px solid #0b2030;
-                    height: 8px;
-                    border-radius: 4px;
-                }
-                QSlider::handle:horizontal {
-                    background: #ffffff;
-                    border: 2px solid #32b8c6;
-                    width: 18px;
-                    margin: -6px 0;
-                    border-radius: 9px;
-                }
-                QSlider::handle:horizontal:hover {
-                    background: #32b8c6;
-                    border: 2px solid #ffffff;
-                }
-            """
-            self.setStyleSheet(dark_stylesheet)
-        else:
-            light_stylesheet = """
-                QMainWindow, QWidget, QFrame { background: #f5f7fa; color: #111111; }
-                QLabel { color: #00ffff; }
-
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #e3f2fd, stop:1 #bbdefb);
-                    color: #0d47a1;
-                    border: 2px solid #1976d2;
-                    border-radius: 8px;
-                    padding: 8px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                                stop:0 #1976d2, stop:1 #1565c0);
-                    color: #ffffff;
-                }
-
-                QLineEdit, QComboBox, QSpinBox {
-                    background: #ffffff;
-                    color: #08B305;
-                    border: 1px solid #1976d2;
-                    border-radius: 5px;
-                    padding: 5px;
-                }
-
-                QListWidget {
-                    background: #ffffff;
-                    color: #FF2800;
-                    border: 1px solid #1976d2;
-                }
-
-                QGroupBox {
-                    color: #0d47a1;
-                    border: 1px solid #1976d2;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-
-                /* 🔹 SLIDERS – LIGHT MODE */
-                QSlider::groove:horizontal {
-                    border: 1px solid #1976d2;
-                    height: 8px;
-                    background: #e3f2fd;
-                    border-radius: 4px;
-                }
-                QSlider::sub-page:horizontal {
-                    background: #1976d2;
-                    border: 1px solid #1976d2;
-                    height: 8px;
-                    border-radius: 4px;
-                }
-                QSlider::add-page:horizontal {
-                    background: #cfd8dc;
-                    border: 1px solid #b0bec5;
-                    height: 8px;
-                    border-radius: 4px;
-                }
-                QSlider::handle:horizontal {
-                    background: #ffffff;
-                    border: 2px solid #1976d2;
-                    width: 18px;
-                    margin: -6px 0;
-                    border-radius: 9px;
-                }
-                QSlider::handle:horizontal:hover {
-                    background: #1976d2;
-                    border: 2px solid #ffffff;
-                }
-            """
-            self.setStyleSheet(light_stylesheet)
-
-    def get_panel_style(self):
-        """Get panel styling"""
-        if self.theme == 'dark':
-            return """
-                QFrame {
-                    background: #1a2635;
-                    border: 2px solid #32b8c6;
-                    border-radius: 10px;
-                    padding: 10px;
-                }
-            """
-        else:
-            return """
-                QFrame {
-                    background: #ffffff;
-                    border: 2px solid #1976d2;
-                    border-radius: 10px;
-                    padding: 10px;
-                }
-            """
-
-    def get_preview_style(self):
-        """Get preview label styling"""
-        if self.theme == 'dark':
-            return """
-                QLabel {
-                    background: #0f1419;
-                    border: 2px dashed #32b8c6;
-                    border-radius: 8px;
-                    color: #32b8c6;
-                }
-            """
+        if self._applied_theme == self.dark:
+            return
+
+        self.setProperty('theme', self.THEME_NAMES[self.dark])
+        if self._applied_theme is None:
+            # Installed once; its selectors key off the property just set
+            self.setStyleSheet(_window_style(self.THEME_NAMES))
         else:
-            return """
-                QLabel {
-                    background: #102027;
-                    border: 2px dashed #1976d2;
-                    border-radius: 8px;
-                    color: #80d8ff;
-                }
-            """
-
-    def get_tab_style(self):
-        """Get tab widget styling"""
-        return ""
+            # Qt does not restyle descendants when an ancestor's property
+            # changes, so re-match every widget against the parsed sheet and
+            # send the StyleChange that setStyleSheet would (refreshes geometry)
+            style = self.style()
+            for widget in [self, *self.findChildren(QWidget)]:
+                style.unpolish(widget)
+                style.polish(widget)
+                QApplication.sendEvent(widget, QEvent(QEvent.StyleChange))
+        self._applied_theme = self.dark
 
     def create_app_icon(self):
         """Create application icon"""
-        icon = QPixmap(64, 64)
-        icon.fill(QColor(50, 184, 198, 0))
-        return QIcon(icon)
+        return _make_app_icon()
 
     # =============== UX helper: slider value labels ===================
 
     def update_strength_label(self, value):
         """Show live encryption strength value"""
-        self.processing_info.setText(
-            f"Encryption Strength: {value}/10 | Output Quality: {self.quality_slider.value()}%"
-        )
+        self._strength = value
+        self._label_timer.start()
 
     def update_quality_label(self, value):
         """Show live output quality value"""
-        self.processing_info.setText(
-            f"Encryption Strength: {self.strength_slider.value()}/10 | Output Quality: {value}%"
-        )
+        self._quality = value
+        self._label_timer.start()
+
+    def _flush_slider_label(self):
+        """Render the latest slider values once the drag burst settles"""
+        self.processing_info.setText(self.SLIDER_LABEL_FMT % (self._strength, self._quality))
 
 
 # ============================================================================
@@ -1250,6 +1806,8 @@ Generated by CryptaPixelon - Advanced AI Edition
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    # Room for plenty of 300x250 preview thumbnails (limit is in KB)
+    QPixmapCache.setCacheLimit(32 * 1024)
     window = CryptaPixelonApp()
     window.show()
     sys.exit(app.exec_())